@@ -2,6 +2,8 @@
 Create a visual comparison chart of Python vs F# for Quantum Game of Life
 """
 
+import matplotlib
+matplotlib.use('Agg')  # Static output only - skip interactive backend startup
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.patches import FancyBboxPatch
@@ -53,7 +55,8 @@ def create_comparison_chart():
                                    boxstyle="round,pad=0.05",
                                    edgecolor='#3776ab', 
                                    facecolor='#3776ab',
-                                   alpha=0.7)
+                                   alpha=0.7,
+                                   rasterized=True)
         ax.add_patch(python_bar)
         ax.text(1 + py_score * 0.35 + 0.1, y_pos, f'{py_score}/10',
                 va='center', fontsize=9, color='#3776ab', fontweight='bold')
@@ -64,7 +67,8 @@ def create_comparison_chart():
                                     boxstyle="round,pad=0.05",
                                     edgecolor='#378bba',
                                     facecolor='#378bba',
-                                    alpha=0.7)
+                                    alpha=0.7,
+                                    rasterized=True)
         ax.add_patch(fsharp_bar)
         ax.text(5 + fs_score * 0.35 + 0.1, y_pos, f'{fs_score}/10',
                 va='center', fontsize=9, color='#378bba', fontweight='bold')
@@ -85,7 +89,8 @@ def create_comparison_chart():
                                 boxstyle="round,pad=0.1",
                                 edgecolor='gray',
                                 facecolor='lightgray',
-                                alpha=0.3)
+                                alpha=0.3,
+                                rasterized=True)
     ax.add_patch(summary_box)
     
     ax.text(5, summary_y + 0.15, 'Overall Scores', ha='center', 
@@ -127,7 +132,8 @@ def create_architecture_diagram():
                             boxstyle="round,pad=0.1",
                             edgecolor='black',
                             facecolor=color,
-                            alpha=0.7)
+                            alpha=0.7,
+                            rasterized=True)
         ax1.add_patch(box)
         ax1.text(x, y, label, ha='center', va='center', 
                 fontsize=10, fontweight='bold')
@@ -159,7 +165,8 @@ def create_architecture_diagram():
                             boxstyle="round,pad=0.1",
                             edgecolor='black',
                             facecolor=color,
-                            alpha=0.7)
+                            alpha=0.7,
+                            rasterized=True)
         ax2.add_patch(box)
         ax2.text(x, y, label, ha='center', va='center',
                 fontsize=10, fontweight='bold')
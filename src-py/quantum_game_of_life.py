@@ -8,11 +8,104 @@ complex probability amplitudes.
 The evolution rules incorporate quantum interference and unitary dynamics.
 """
 
+import math
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from typing import Tuple, Optional
 
+# Numba is optional (see requirements.txt); without it the NumPy
+# vectorized path is used instead.
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Offsets of the 8 neighbors in the Moore neighborhood
+NEIGHBOR_OFFSETS = [(di, dj) for di in (-1, 0, 1) for dj in (-1, 0, 1)
+                    if (di, dj) != (0, 0)]
+
+
+def _expi(x: np.ndarray) -> np.ndarray:
+    """
+    e^(ix) as cos(x) + i*sin(x).
+
+    Cheaper than np.exp(1j * x), which forms a complex argument and
+    evaluates the full complex exponential (including exp of the real
+    part, which is always zero here).
+    """
+    return np.cos(x) + 1j * np.sin(x)
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _step_numba(state, out, periodic):
+        """
+        Fused single-pass stepper: neighbor stencil plus quantum rule.
+
+        Equivalent to count_quantum_neighbors + quantum_rule_array but
+        with no temporary arrays - each cell is read, evolved, and
+        written in one pass, parallelized over rows.
+        """
+        rows, cols = state.shape
+        for i in numba.prange(rows):
+            for j in range(cols):
+                neighbor_sum = 0.0 + 0.0j
+                for di in (-1, 0, 1):
+                    for dj in (-1, 0, 1):
+                        if di == 0 and dj == 0:
+                            continue
+                        ni = i + di
+                        nj = j + dj
+                        if periodic:
+                            ni %= rows
+                            nj %= cols
+                        elif ni < 0 or ni >= rows or nj < 0 or nj >= cols:
+                            continue
+                        neighbor_sum += state[ni, nj]
+
+                cell = state[i, j]
+                alive_prob = cell.real * cell.real + cell.imag * cell.imag
+                neighbor_count = (neighbor_sum.real * neighbor_sum.real +
+                                  neighbor_sum.imag * neighbor_sum.imag)
+                neighbor_phase = math.atan2(neighbor_sum.imag, neighbor_sum.real)
+
+                if alive_prob > 0.5:
+                    d = neighbor_count - 2.5
+                    survival_factor = math.exp(-0.5 * d * d)
+                    new_amplitude = cell * (0.3 + 0.7 * survival_factor)
+                else:
+                    d = neighbor_count - 3.0
+                    birth_factor = math.exp(-0.5 * d * d)
+                    new_amplitude = complex(birth_factor * math.cos(neighbor_phase),
+                                            birth_factor * math.sin(neighbor_phase))
+
+                magnitude = abs(new_amplitude)
+                if magnitude > 1.0:
+                    scale = 1.0 / magnitude
+                elif magnitude > 1e-15:
+                    scale = 1.0
+                else:
+                    scale = 0.0
+
+                kick = 0.1 * neighbor_phase
+                out[i, j] = new_amplitude * scale * complex(math.cos(kick),
+                                                            math.sin(kick))
+
+    @numba.njit(cache=True)
+    def _step_n_numba(state, scratch, periodic, n):
+        """
+        Run n fused steps without returning to Python, swapping the
+        state and scratch buffers between iterations. Returns the
+        (final state, scratch) pair so the caller can keep both.
+        """
+        for _ in range(n):
+            _step_numba(state, scratch, periodic)
+            state, scratch = scratch, state
+        return state, scratch
+
 
 class QuantumGameOfLife:
     """
@@ -36,11 +129,25 @@ class QuantumGameOfLife:
         self.periodic = periodic
         
         # State representation: complex amplitudes for |alive⟩ state
-        # (amplitude for |dead⟩ is implicitly sqrt(1 - |alive_amp|²))
-        self.state = np.zeros((self.rows, self.cols), dtype=np.complex128)
-        
-        # Phase accumulation for quantum dynamics
-        self.phase = np.zeros((self.rows, self.cols), dtype=np.float64)
+        # (amplitude for |dead⟩ is implicitly sqrt(1 - |alive_amp|²)).
+        # Single precision: the stencil is memory-bound, so halving the
+        # bytes per cell halves the memory traffic per step. Each step
+        # matches an FP64 run to FP32 roundoff (~1e-7), but the
+        # alive_prob > 0.5 branch amplifies roundoff, so FP32 and FP64
+        # trajectories decorrelate after roughly 20 steps - as any two
+        # nearby trajectories of this system do. Amplitudes stay
+        # clipped to [0, 1] and the qualitative dynamics are unchanged;
+        # use complex128 here if bit-level reproducibility against a
+        # double-precision run matters more than speed.
+        self.state = np.zeros((self.rows, self.cols), dtype=np.complex64)
+
+        # Scratch buffer for step(): the new state is written here and
+        # the two buffers are swapped, so stepping allocates nothing.
+        self._scratch = np.empty_like(self.state)
+
+        # Lazily computed np.angle(state), invalidated whenever the
+        # state changes (see get_phase)
+        self._phase_cache = None
         
     def set_classical_state(self, pattern: np.ndarray):
         """
@@ -49,7 +156,8 @@ class QuantumGameOfLife:
         Args:
             pattern: Binary array (1 = alive, 0 = dead)
         """
-        self.state = pattern.astype(np.complex128)
+        self.state = pattern.astype(np.complex64)
+        self._phase_cache = None
         
     def set_quantum_state(self, amplitudes: np.ndarray):
         """
@@ -58,11 +166,14 @@ class QuantumGameOfLife:
         Args:
             amplitudes: Complex array representing |alive⟩ amplitudes
         """
-        # Normalize to ensure valid quantum states
+        # Normalize to ensure valid quantum states: rescale amplitudes
+        # whose magnitude exceeds 1. Multiplying by a real factor keeps
+        # the phase as-is, so no angle/exp round-trip is needed.
         norms = np.abs(amplitudes)
-        norms = np.clip(norms, 0, 1)  # Ensure physical states
-        phases = np.angle(amplitudes)
-        self.state = norms * np.exp(1j * phases)
+        scale = np.ones_like(norms)
+        np.divide(1.0, norms, out=scale, where=norms > 1.0)
+        self.state = (amplitudes * scale).astype(np.complex64)
+        self._phase_cache = None
         
     def add_superposition(self, row: int, col: int, alive_prob: float = 0.5, phase: float = 0):
         """
@@ -75,6 +186,25 @@ class QuantumGameOfLife:
         """
         amplitude = np.sqrt(alive_prob) * np.exp(1j * phase)
         self.state[row, col] = amplitude
+        self._phase_cache = None
+
+    def add_superpositions(self, rows: np.ndarray, cols: np.ndarray,
+                           alive_probs=0.5, phases=0.0):
+        """
+        Set a batch of cells to superposition states in one call.
+
+        Vectorized counterpart of add_superposition: amplitudes for all
+        listed cells are computed in one pass and written with a single
+        fancy-indexed assignment.
+
+        Args:
+            rows, cols: Arrays of cell coordinates
+            alive_probs: Probabilities of being alive, broadcast over cells
+            phases: Quantum phases, broadcast over cells
+        """
+        amplitudes = np.sqrt(alive_probs) * np.exp(1j * np.asarray(phases, dtype=float))
+        self.state[np.asarray(rows), np.asarray(cols)] = amplitudes
+        self._phase_cache = None
         
     def get_probability(self) -> np.ndarray:
         """
@@ -83,95 +213,151 @@ class QuantumGameOfLife:
         Returns:
             Array of probabilities |ψ_alive|²
         """
-        return np.abs(self.state) ** 2
+        # real² + imag² gives |ψ|² directly, skipping the sqrt that
+        # np.abs would take only to be squared away again
+        return self.state.real ** 2 + self.state.imag ** 2
+
+    def get_phase(self) -> np.ndarray:
+        """
+        Get the quantum phase of each cell.
+
+        Returns:
+            Array of phases arg(ψ_alive)
+
+        The result is cached until the state changes, so repeated
+        reads (e.g. redrawing a phase plot) only pay for np.angle
+        once per step.
+        """
+        if self._phase_cache is None:
+            self._phase_cache = np.angle(self.state)
+        return self._phase_cache
     
-    def count_quantum_neighbors(self, i: int, j: int) -> complex:
+    def count_quantum_neighbors(self) -> np.ndarray:
         """
-        Count neighbors using quantum amplitudes.
-        
-        Returns the sum of complex amplitudes of neighboring cells.
+        Count neighbors using quantum amplitudes, for the whole grid at once.
+
+        Returns an array where each entry is the sum of the complex
+        amplitudes of that cell's 8 neighbors. The sum is computed with
+        shifted whole-array views (np.roll for periodic boundaries, a
+        zero-padded slice otherwise), so the work happens inside NumPy's
+        C loops rather than per-cell Python code.
+
+        A scipy.signal.convolve2d / FFT circular-convolution stencil was
+        measured as an alternative, but for a 3x3 Moore kernel the
+        direct shifted sum is faster at every grid size tried (128² to
+        1024²), so the roll-based stencil is kept for all sizes.
         """
-        neighbor_sum = 0 + 0j
-        
-        for di in [-1, 0, 1]:
-            for dj in [-1, 0, 1]:
-                if di == 0 and dj == 0:
-                    continue
-                    
-                if self.periodic:
-                    ni = (i + di) % self.rows
-                    nj = (j + dj) % self.cols
-                else:
-                    ni = i + di
-                    nj = j + dj
-                    if ni < 0 or ni >= self.rows or nj < 0 or nj >= self.cols:
-                        continue
-                
-                neighbor_sum += self.state[ni, nj]
-        
+        if self.periodic:
+            neighbor_sum = np.roll(self.state, NEIGHBOR_OFFSETS[0], axis=(0, 1))
+            for di, dj in NEIGHBOR_OFFSETS[1:]:
+                np.add(neighbor_sum, np.roll(self.state, (di, dj), axis=(0, 1)),
+                       out=neighbor_sum)
+            return neighbor_sum
+
+        # Zero-pad by one cell so every shifted window stays in bounds
+        padded = np.pad(self.state, 1)
+        neighbor_sum = np.zeros_like(self.state)
+        for di, dj in NEIGHBOR_OFFSETS:
+            np.add(neighbor_sum,
+                   padded[1 + di:1 + di + self.rows, 1 + dj:1 + dj + self.cols],
+                   out=neighbor_sum)
         return neighbor_sum
     
-    def quantum_rule(self, cell_state: complex, neighbor_sum: complex) -> complex:
+    def quantum_rule_array(self, state: np.ndarray, neighbor_sum: np.ndarray) -> np.ndarray:
         """
-        Apply quantum evolution rules.
-        
+        Apply quantum evolution rules to the whole grid at once.
+
         This implements a quantum version of Conway's rules:
         - Classical rules apply based on probability amplitudes
         - Quantum interference from neighbors affects evolution
         - Unitary evolution preserves normalization
-        
+
+        Both branches of the rule are evaluated as whole-array ufunc
+        passes and selected per cell with np.where, so no Python-level
+        branching happens inside the grid.
+
         Args:
-            cell_state: Current complex amplitude of cell
-            neighbor_sum: Sum of neighbor amplitudes
-            
+            state: Current complex amplitudes of all cells
+            neighbor_sum: Sum of neighbor amplitudes per cell
+
         Returns:
-            New complex amplitude
+            New complex amplitude array
         """
         # Get probability and neighbor count
-        alive_prob = np.abs(cell_state) ** 2
-        neighbor_prob = np.abs(neighbor_sum) ** 2 / 8.0  # Normalize by max neighbors
+        # (|z|² as real² + imag² avoids a sqrt that abs() would take)
+        alive_prob = state.real ** 2 + state.imag ** 2
+        neighbor_count = neighbor_sum.real ** 2 + neighbor_sum.imag ** 2
         neighbor_phase = np.angle(neighbor_sum)
-        
+
         # Classical Game of Life rules with quantum smoothing
         # Survival: 2-3 neighbors
         # Birth: 3 neighbors
-        
+
         # Continuous version of the rules
-        if alive_prob > 0.5:  # Cell is more alive than dead
-            # Survival rule: optimal at 2-3 neighbors
-            survival_factor = np.exp(-((neighbor_prob * 8 - 2.5) ** 2) / 2.0)
-            new_amplitude = cell_state * (0.3 + 0.7 * survival_factor)
-        else:  # Cell is more dead than alive
-            # Birth rule: optimal at 3 neighbors
-            birth_factor = np.exp(-((neighbor_prob * 8 - 3.0) ** 2) / 2.0)
-            new_amplitude = birth_factor * np.exp(1j * neighbor_phase)
-        
-        # Add quantum phase evolution from neighbors
+        # Survival rule: optimal at 2-3 neighbors
+        survival_factor = np.exp(-((neighbor_count - 2.5) ** 2) / 2.0)
+        # Birth rule: optimal at 3 neighbors
+        birth_factor = np.exp(-((neighbor_count - 3.0) ** 2) / 2.0)
+
+        # Cells more alive than dead survive, the rest may be born
+        new_amplitude = np.where(alive_prob > 0.5,
+                                 state * (0.3 + 0.7 * survival_factor),
+                                 birth_factor * _expi(neighbor_phase))
+
+        # Add quantum phase evolution from neighbors. Rather than
+        # decomposing into magnitude and phase and rebuilding with a
+        # second exp, stay in Cartesian form: rescale magnitudes that
+        # exceed 1 (clipping to valid amplitudes) and multiply in the
+        # phase coupling as a single unit complex factor.
         phase_coupling = 0.1
-        quantum_phase = np.angle(cell_state) + phase_coupling * neighbor_phase
-        
-        # Reconstruct with evolved phase
-        new_magnitude = np.abs(new_amplitude)
-        new_amplitude = new_magnitude * np.exp(1j * quantum_phase)
-        
-        # Ensure normalization (clip to valid probability amplitudes)
-        new_magnitude = min(np.abs(new_amplitude), 1.0)
-        new_amplitude = new_magnitude * np.exp(1j * np.angle(new_amplitude))
-        
-        return new_amplitude
-    
+        magnitude = np.abs(new_amplitude)
+        scale = np.zeros_like(magnitude)
+        np.divide(np.minimum(magnitude, 1.0), magnitude,
+                  out=scale, where=magnitude > 1e-15)
+        return new_amplitude * scale * _expi(phase_coupling * neighbor_phase)
+
     def step(self):
         """
         Evolve the quantum Game of Life by one time step.
+
+        Uses the fused Numba kernel when numba is installed, otherwise
+        the vectorized NumPy path.
         """
-        new_state = np.zeros_like(self.state)
-        
-        for i in range(self.rows):
-            for j in range(self.cols):
-                neighbor_sum = self.count_quantum_neighbors(i, j)
-                new_state[i, j] = self.quantum_rule(self.state[i, j], neighbor_sum)
-        
-        self.state = new_state
+        if NUMBA_AVAILABLE:
+            scratch = self._scratch
+            if scratch.shape != self.state.shape or scratch.dtype != self.state.dtype:
+                # State was replaced (e.g. set_classical_state with a
+                # different grid); rebuild the buffer to match.
+                scratch = self._scratch = np.empty_like(self.state)
+            _step_numba(self.state, scratch, self.periodic)
+            self.state, self._scratch = scratch, self.state
+        else:
+            neighbor_sum = self.count_quantum_neighbors()
+            self.state = self.quantum_rule_array(self.state, neighbor_sum)
+        self._phase_cache = None
+
+    def step_n(self, n: int):
+        """
+        Evolve the quantum Game of Life by n time steps.
+
+        On the Numba path the whole loop runs inside compiled code,
+        swapping the two state buffers between iterations, so a long
+        evolution pays the Python call overhead once rather than per
+        step. Falls back to n calls of the vectorized step otherwise.
+
+        Args:
+            n: Number of time steps
+        """
+        if NUMBA_AVAILABLE:
+            scratch = self._scratch
+            if scratch.shape != self.state.shape or scratch.dtype != self.state.dtype:
+                scratch = self._scratch = np.empty_like(self.state)
+            self.state, self._scratch = _step_n_numba(self.state, scratch,
+                                                      self.periodic, n)
+            self._phase_cache = None
+        else:
+            for _ in range(n):
+                self.step()
         
     def measure(self, threshold: float = 0.5) -> np.ndarray:
         """
@@ -184,7 +370,9 @@ class QuantumGameOfLife:
             Classical binary array
         """
         probabilities = self.get_probability()
-        return (probabilities > threshold).astype(int)
+        # A bool array is already 0/1 bytes in memory; viewing it as
+        # uint8 reinterprets it in place instead of copying to int
+        return (probabilities > threshold).view(np.uint8)
 
 
 def create_glider_pattern(size: Tuple[int, int]) -> np.ndarray:
@@ -219,28 +407,69 @@ def visualize_quantum_game(qgol: QuantumGameOfLife, steps: int = 100, interval:
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
     
     # Initialize plots
-    prob_plot = ax1.imshow(qgol.get_probability(), cmap='viridis', vmin=0, vmax=1)
+    prob_plot = ax1.imshow(qgol.get_probability(), cmap='viridis', vmin=0, vmax=1, interpolation='nearest')
     ax1.set_title('Probability |ψ|²')
     ax1.axis('off')
     plt.colorbar(prob_plot, ax=ax1)
     
-    phase_plot = ax2.imshow(np.angle(qgol.state), cmap='twilight', vmin=-np.pi, vmax=np.pi)
+    phase_plot = ax2.imshow(qgol.get_phase(), cmap='twilight', vmin=-np.pi, vmax=np.pi, interpolation='nearest')
     ax2.set_title('Phase arg(ψ)')
     ax2.axis('off')
     plt.colorbar(phase_plot, ax=ax2)
     
+    # The step counter lives inside ax1: blitting only copies and
+    # restores the axes bbox regions, so text outside every axes would
+    # render into the buffer but never reach the screen.
+    title = ax1.text(0.5, 0.98, 'Quantum Game of Life - Step 0',
+                     transform=ax1.transAxes, ha='center', va='top',
+                     color='white')
+
     def update(frame):
         qgol.step()
-        prob_plot.set_array(qgol.get_probability())
-        phase_plot.set_array(np.angle(qgol.state))
-        fig.suptitle(f'Quantum Game of Life - Step {frame}')
-        return prob_plot, phase_plot
-    
-    anim = FuncAnimation(fig, update, frames=steps, interval=interval, blit=False)
+        prob_plot.set_data(qgol.get_probability())
+        phase_plot.set_data(qgol.get_phase())
+        title.set_text(f'Quantum Game of Life - Step {frame}')
+        return prob_plot, phase_plot, title
+
+    # Blitting redraws only the returned artists (images and title)
+    # instead of the whole figure - axes, colorbars and labels are
+    # rendered once and reused every frame.
+    anim = FuncAnimation(fig, update, frames=steps, interval=interval, blit=True)
     plt.tight_layout()
     return fig, anim
 
 
+def export_frames(qgol: QuantumGameOfLife, steps: int, figsize: Tuple[int, int] = (5, 5)):
+    """
+    Render the evolution to raw RGBA frames.
+
+    Yields one (height, width, 4) uint8 array per step, taken straight
+    from the Agg renderer via buffer_rgba() - a zero-copy view of the
+    canvas pixel buffer, with no PNG encode/decode in between. The
+    buffer is reused between frames, so copy a frame if it needs to
+    outlive the next draw.
+
+    Args:
+        qgol: QuantumGameOfLife instance to evolve
+        steps: Number of frames to render
+        figsize: Figure size in inches
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    fig = Figure(figsize=figsize)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.axis('off')
+    image = ax.imshow(qgol.get_probability(), cmap='viridis', vmin=0, vmax=1, interpolation='nearest')
+
+    for _ in range(steps):
+        qgol.step()
+        image.set_data(qgol.get_probability())
+        canvas.draw()
+        yield np.asarray(canvas.buffer_rgba())
+
+
 def main():
     """Demonstration of the Quantum Game of Life."""
     
@@ -251,14 +480,15 @@ def main():
     # Initialize with quantum glider
     create_quantum_glider(qgol)
     
-    # Add some random quantum noise
+    # Add some random quantum noise: pick ~30% of the cells in the
+    # region and write them all with one batched superposition call.
     noise_level = 0.1
-    for i in range(5, 15):
-        for j in range(5, 15):
-            if np.random.random() < 0.3:
-                qgol.add_superposition(i, j, 
-                                      alive_prob=noise_level * np.random.random(),
-                                      phase=2 * np.pi * np.random.random())
+    mask = np.random.random((10, 10)) < 0.3
+    noise_rows, noise_cols = np.nonzero(mask)
+    n_noisy = noise_rows.size
+    qgol.add_superpositions(noise_rows + 5, noise_cols + 5,
+                            alive_probs=noise_level * np.random.random(n_noisy),
+                            phases=2 * np.pi * np.random.random(n_noisy))
     
     print("Quantum Game of Life initialized")
     print(f"Grid size: {size}")
@@ -267,23 +497,32 @@ def main():
     # Run simulation
     print("\nSimulating quantum evolution...")
     
-    # Static visualization of first few steps
-    fig, axes = plt.subplots(2, 3, figsize=(15, 10))
+    # Evolve first, copying a probability snapshot at each step of
+    # interest, so the simulation runs back-to-back in numeric code
+    # without plotting work interleaved between batches of steps.
     steps_to_show = [0, 10, 20, 30, 40, 50]
-    
+    snapshots = []
+    current_step = 0
+    for step in steps_to_show:
+        qgol.step_n(step - current_step)
+        current_step = step
+        snapshots.append(qgol.get_probability().copy())
+
+    # Tile the snapshots into one (2*rows, 3*cols) mosaic and render it
+    # with a single imshow - one AxesImage for the whole figure instead
+    # of six subplots - with the step numbers overlaid as text labels.
+    # All panels share the same [0, 1] scale, so one colorbar serves
+    # the entire mosaic.
+    tiled = np.block([snapshots[:3], snapshots[3:]])
+    fig, ax = plt.subplots(figsize=(15, 10))
+    im = ax.imshow(tiled, cmap='viridis', vmin=0, vmax=1, interpolation='nearest')
+    ax.axis('off')
     for idx, step in enumerate(steps_to_show):
-        for _ in range(step - (steps_to_show[idx-1] if idx > 0 else 0)):
-            qgol.step()
-        
-        ax = axes[idx // 3, idx % 3]
-        prob = qgol.get_probability()
-        im = ax.imshow(prob, cmap='viridis', vmin=0, vmax=1)
-        ax.set_title(f'Step {step}')
-        ax.axis('off')
-        plt.colorbar(im, ax=ax)
-    
+        ax.text((idx % 3) * qgol.cols + 1, (idx // 3) * qgol.rows + 1,
+                f'Step {step}', color='white', fontsize=12, va='top')
+    fig.colorbar(im, ax=ax, fraction=0.03, pad=0.02)
+
     plt.suptitle('Quantum Game of Life Evolution', fontsize=16)
-    plt.tight_layout()
     plt.savefig('/mnt/user-data/outputs/quantum_game_of_life.png', dpi=150, bbox_inches='tight')
     print("Saved visualization to quantum_game_of_life.png")
     
@@ -292,8 +531,11 @@ def main():
     # create_quantum_glider(qgol2)
     # fig_anim, anim = visualize_quantum_game(qgol2, steps=100, interval=50)
     # plt.show()
-    
-    plt.show()
+
+    # Only open a window when an interactive backend is in use, so
+    # headless runs (e.g. MPLBACKEND=Agg in CI) don't block on show()
+    if plt.get_backend().lower() != 'agg':
+        plt.show()
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ Reads CSV files generated by the F# implementation and creates visualizations
 """
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Static output only - skip interactive backend startup
 import matplotlib.pyplot as plt
 from pathlib import Path
 
@@ -28,7 +30,7 @@ def visualize_fsharp_output():
             state = load_quantum_state(filename)
             
             ax = axes[idx // 3, idx % 3]
-            im = ax.imshow(state, cmap='viridis', vmin=0, vmax=1)
+            im = ax.imshow(state, cmap='viridis', vmin=0, vmax=1, interpolation='nearest')
             ax.set_title(f'Step {step} - Probability |ψ|²', fontsize=12)
             ax.axis('off')
             plt.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
@@ -49,17 +51,17 @@ def visualize_fsharp_output():
     final = load_quantum_state(output_dir / 'quantum_state_step_050.csv')
     difference = final - initial
     
-    im1 = ax1.imshow(initial, cmap='viridis', vmin=0, vmax=1)
+    im1 = ax1.imshow(initial, cmap='viridis', vmin=0, vmax=1, interpolation='nearest')
     ax1.set_title('Initial State (Step 0)')
     ax1.axis('off')
     plt.colorbar(im1, ax=ax1)
     
-    im2 = ax2.imshow(final, cmap='viridis', vmin=0, vmax=1)
+    im2 = ax2.imshow(final, cmap='viridis', vmin=0, vmax=1, interpolation='nearest')
     ax2.set_title('Final State (Step 50)')
     ax2.axis('off')
     plt.colorbar(im2, ax=ax2)
     
-    im3 = ax3.imshow(difference, cmap='RdBu_r', vmin=-1, vmax=1)
+    im3 = ax3.imshow(difference, cmap='RdBu_r', vmin=-1, vmax=1, interpolation='nearest')
     ax3.set_title('Difference (Final - Initial)')
     ax3.axis('off')
     plt.colorbar(im3, ax=ax3)
@@ -70,8 +72,6 @@ def visualize_fsharp_output():
     comparison_file = output_dir / 'fsharp_quantum_comparison.png'
     plt.savefig(comparison_file, dpi=150, bbox_inches='tight')
     print(f"Saved comparison to {comparison_file}")
-    
-    plt.show()
 
 if __name__ == "__main__":
     visualize_fsharp_output()